@@ -0,0 +1,163 @@
+"""Compare peak memory of the old nested dicts and the records for a deep crawl.
+
+Both sides go through crawl, writing floors.json and matching replies. Floors
+are pickled per post, as Pool does with worker results. The records side calls
+ReadPost.read_and_save and SendPost.get_replies_metadata, run in a temporary
+directory without the network.
+
+Usage: python measure_memory.py [n_posts] [n_floors_per_post]
+"""
+import json
+import os
+import pickle
+import tempfile
+import tracemalloc
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from sys import argv
+
+from read_posts import ReadPost
+from records import SHANGHAI, Floor, Post, get_page_url, to_timestamp
+from send_posts import SendPost
+
+sub_name = "bxj"
+query = "#舔狗日记#"
+floors_per_page = 20
+start = datetime(2021, 6, 1, tzinfo=SHANGHAI)
+usernames = [f"用户{i}" for i in range(500)]
+
+
+def floor_fields(post_index, floor_num):
+    # build fresh strings each time, as parsing html does
+    floor_id = str(50000000 + post_index * 1000 + floor_num) if floor_num else "tpc"
+    keyword = query if floor_num % 10 == 0 else ""
+    return (
+        floor_id,
+        floor_num // floors_per_page + 1,
+        "".join(usernames[(post_index + floor_num) % len(usernames)]),
+        f"第{floor_num}楼 回复内容 {keyword} {post_index}",
+        start + timedelta(minutes=floor_num),
+    )
+
+
+def crawl_dicts(n_posts, n_floors):
+    all_floors = {}
+    for i in range(n_posts):
+        post_id = str(40000000 + i)
+        post_url = f"http://bbs.hupu.com/{post_id}.html"
+        floors = {}
+        for floor_num in range(n_floors):
+            floor_id, page, username, content, time = floor_fields(i, floor_num)
+            floors[floor_num] = {
+                "floor_id": floor_id,
+                "floor_url": f"{get_page_url(post_url, page)}#{floor_id}",
+                "username": username,
+                "content": content,
+                "time": time.isoformat(),
+            }
+        all_floors[post_id] = {
+            "meta": {
+                "sub": "".join(sub_name),
+                "sub_id": "".join("34"),
+                "post_url": post_url,
+                "post_title": f"标题 {i}",
+                "n_pages": n_floors // floors_per_page + 1,
+                "last_reply_time": start.isoformat(),
+            },
+            "floors": pickle.loads(pickle.dumps(OrderedDict(sorted(floors.items())))),
+        }
+    return OrderedDict(sorted(all_floors.items()))
+
+
+def crawl_records(n_posts, n_floors):
+    all_floors = []
+    for i in range(n_posts):
+        post_id = str(40000000 + i)
+        floors = {}
+        for floor_num in range(n_floors):
+            floor_id, page, username, content, time = floor_fields(i, floor_num)
+            floors[floor_num] = Floor(
+                floor_num, floor_id, page, username, content, to_timestamp(time)
+            )
+        all_floors.append(
+            Post(
+                sub="".join(sub_name),
+                sub_id="".join("34"),
+                post_id=post_id,
+                post_url=f"http://bbs.hupu.com/{post_id}.html",
+                post_title=f"标题 {i}",
+                n_pages=n_floors // floors_per_page + 1,
+                last_reply_time=to_timestamp(start),
+                floors=pickle.loads(pickle.dumps(list(floors.values()))),
+            )
+        )
+    return all_floors
+
+
+def read_dicts(n_posts, n_floors):
+    result = crawl_dicts(n_posts, n_floors)
+    with open(f"data/{sub_name}/floors.json", "w", encoding="utf-8") as f:
+        f.write(json.dumps(result, indent=4, ensure_ascii=False))
+
+
+def send_dicts():
+    with open(f"data/{sub_name}/floors.json", encoding="utf-8") as f:
+        floors_to_reply = json.loads(f.read())
+    reply_metadata = []
+    for post_id, post in floors_to_reply.items():
+        for floor in post["floors"].values():
+            if query in floor["content"]:
+                reply_metadata.append(
+                    {
+                        "quote_floor_id": floor["floor_id"],
+                        "content": f"汪\n\n{SendPost.signature}",
+                        "sub_id": post["meta"]["sub_id"],
+                        "post_id": post_id,
+                    }
+                )
+    return reply_metadata
+
+
+def read_records(n_posts, n_floors):
+    read_post = ReadPost.__new__(ReadPost)
+    read_post.sub_name = sub_name
+    read_post.get_all_floors = lambda: crawl_records(n_posts, n_floors)
+    read_post.read_and_save()
+
+
+def send_records():
+    send_post = SendPost.__new__(SendPost)
+    send_post.sub_name = sub_name
+    send_post.do_not_reply_users = []
+    send_post.previously_replied_floors = []
+    return send_post.get_replies_metadata([query], "keyword")
+
+
+def measure(function, *args):
+    tracemalloc.start()
+    function(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main(n_posts, n_floors):
+    os.makedirs(f"data/{sub_name}/input")
+    with open(f"data/{sub_name}/input/keyword_reply.json", "w", encoding="utf-8") as f:
+        f.write(json.dumps({query: ["汪"]}, ensure_ascii=False))
+    print(f"{n_posts} posts x {n_floors} floors, peak MiB")
+    for name, read, send in [
+        ("dicts", read_dicts, send_dicts),
+        ("records", read_records, send_records),
+    ]:
+        read_peak = measure(read, n_posts, n_floors)
+        send_peak = measure(send)
+        print(f"{name:8} read {read_peak / 2**20:6.1f}  send {send_peak / 2**20:6.1f}")
+
+
+if __name__ == "__main__":
+    n_posts = int(argv[1]) if len(argv) > 1 else 2000
+    n_floors = int(argv[2]) if len(argv) > 2 else 200
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        main(n_posts, n_floors)
@@ -1,9 +1,9 @@
 import json
 import re
-from collections import OrderedDict
 from datetime import datetime, timedelta
 import logging
 from multiprocessing.pool import Pool
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple, Union
 from sys import argv
 
@@ -15,6 +15,7 @@ from pytz import timezone
 from urllib3.util.retry import Retry
 
 from exceptions import PageCountNotMatchException, PostDeletedException
+from records import SHANGHAI, Floor, Post, get_page_url, to_timestamp, write_posts
 
 
 class ReadPost:
@@ -89,10 +90,10 @@ class ReadPost:
     def _filter_strings(self, input: str, *args) -> str:
         return re.sub(rf"({'|'.join(args)})", "", input)
 
-    def get_posts_from_sub_page(self, sub_page_url: str) -> Dict:
+    def get_posts_from_sub_page(self, sub_page_url: str) -> Dict[str, Post]:
         response = self._try_catch_requests(sub_page_url)
         if response == -1:
-            return []
+            return {}
         html_text = response.text
 
         soup = BeautifulSoup(html_text.replace("&nbsp;", " "), "html.parser")
@@ -114,7 +115,7 @@ class ReadPost:
                     minute=59,
                     second=59,
                     microsecond=999999,
-                    tzinfo=timezone("Asia/Shanghai"),
+                    tzinfo=SHANGHAI,
                 )
             elif ":" in last_reply_time:  # time
                 hour, minute = (
@@ -134,17 +135,18 @@ class ReadPost:
                 post_title = re.sub(r"\n", "", post_title)
                 pages = post.select_one("span.multipage")
                 n_pages = 1 if pages is None else int(pages.select("a")[-1].get_text())
-                posts[post_id] = {
-                    "sub": self.sub_name,
-                    "sub_id": self.sub_name_id_map[self.sub_name],
-                    "post_url": post_url,
-                    "post_title": post_title,
-                    "n_pages": n_pages,
-                    "last_reply_time": last_reply_time.isoformat(),
-                }
+                posts[post_id] = Post(
+                    sub=self.sub_name,
+                    sub_id=self.sub_name_id_map[self.sub_name],
+                    post_id=post_id,
+                    post_url=post_url,
+                    post_title=post_title,
+                    n_pages=n_pages,
+                    last_reply_time=to_timestamp(last_reply_time),
+                )
         return posts
 
-    def get_all_posts(self) -> Dict:
+    def get_all_posts(self) -> Dict[str, Post]:
         sub_url = f"{self.website_url}/{self.sub_name}"
         sub_page_urls = [
             f"{sub_url}-{sub_page}" for sub_page in range(1, self.sub_pages_to_read + 1)
@@ -157,11 +159,12 @@ class ReadPost:
         return posts
 
     def get_floors_for_page(
-        self, page_url: str, n_pages: int
-    ) -> Tuple[Union[Dict, bool]]:
+        self, post_url: str, page: int, n_pages: int
+    ) -> Tuple[Union[Dict[int, Floor], bool]]:
+        page_url = get_page_url(post_url, page)
         response = self._try_catch_requests(page_url)
         if response == -1:
-            return [], True
+            return {}, True
         html_text = response.text
         try:
             page_count = int(re.findall(r"(?<=\bpageCount:)(\d+)", html_text)[0])
@@ -174,13 +177,12 @@ class ReadPost:
         soup = BeautifulSoup(html_text.replace("&nbsp;", " "), "html.parser")
         floors: bs4.element.ResultSet = soup.select("div.floor-show  ")
         if not floors:
-            return [], True
+            return {}, True
         else:
             for floor in floors[::-1]:
                 floor_anchor: BeautifulSoup = floor.select_one(".floornum")
                 floor_num = int(floor_anchor.get("id"))
                 floor_id: str = floor_anchor.get("href").split("#")[1]
-                floor_url = f"{page_url}#{floor_id}"
                 floor_content: BeautifulSoup = floor.select_one("td")
                 if floor_num == 0:
                     floor_content = floor_content.select_one(".quote-content")
@@ -219,25 +221,25 @@ class ReadPost:
 
                 if add_floor_query and add_floor_time:
                     floor_username: str = floor.select_one(".j_u").get("uname")
-                    floor_contents[floor_num] = {
-                        "floor_id": floor_id,
-                        "floor_url": floor_url,
-                        "username": floor_username,
-                        "content": floor_content_text,
-                        "time": floor_time.isoformat(),
-                    }
+                    floor_contents[floor_num] = Floor(
+                        floor_num=floor_num,
+                        floor_id=floor_id,
+                        page=page,
+                        username=floor_username,
+                        content=floor_content_text,
+                        time=to_timestamp(floor_time),
+                    )
                 elif not add_floor_time:
                     break
         read_previous_page = add_floor_time  # if False, don't read previous page
         return floor_contents, read_previous_page
 
-    def get_floors_for_post(self, post_url: str, n_pages: int) -> Dict:
+    def get_floors_for_post(self, post_url: str, n_pages: int) -> List[Floor]:
         floor_contents = {}
         try:
             for page in range(n_pages, 0, -1):
-                page_url = post_url if page == 1 else post_url[:-5] + f"-{page}.html"
                 floor_for_page, read_previous_page = self.get_floors_for_page(
-                    page_url, n_pages
+                    post_url, page, n_pages
                 )
                 floor_contents |= floor_for_page
                 if not read_previous_page:
@@ -245,34 +247,32 @@ class ReadPost:
         except PageCountNotMatchException as e:
             return self.get_floors_for_post(post_url, e.page_count)
         except PostDeletedException:
-            return {}
-        return OrderedDict(sorted(floor_contents.items()))
+            return []
+        return sorted(floor_contents.values(), key=attrgetter("floor_num"))
 
-    def get_all_floors(self) -> Dict:
+    def get_all_floors(self) -> List[Post]:
         posts = self.get_all_posts()
-        post_ids = list(posts.keys())
+        post_ids = sorted(posts.keys())
         args = [
-            (posts[post_id]["post_url"], posts[post_id]["n_pages"])
-            for post_id in post_ids
+            (posts[post_id].post_url, posts[post_id].n_pages) for post_id in post_ids
         ]
         pool = Pool(processes=20)
         # syncronous, for debug only.
         # floors_list = [self.get_floors_for_post(*arg) for arg in args]
         floors_list = pool.starmap(self.get_floors_for_post, args)
-        all_floors = {}
+        all_floors = []
         for i in range(len(post_ids)):
-            post_id = post_ids[i]
+            post = posts[post_ids[i]]
             floors = floors_list[i]
             if floors:
-                all_floors[post_id] = {}
-                all_floors[post_id]["meta"] = posts[post_id]
-                all_floors[post_id]["floors"] = floors
-        return OrderedDict(sorted(all_floors.items()))
+                post.floors = floors
+                all_floors.append(post)
+        return all_floors
 
     def read_and_save(self):
         result = self.get_all_floors()
         with open(f"data/{self.sub_name}/floors.json", "w", encoding="utf-8") as f:
-            f.write(json.dumps(result, indent=4, ensure_ascii=False))
+            write_posts(result, f)
 
 
 def read_posts(sub_name, sub_pages_to_read, time_ago, reply_type="keyword"):
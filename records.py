@@ -0,0 +1,152 @@
+import json
+from datetime import datetime, timedelta, timezone
+from sys import intern
+from typing import Dict, List, TextIO
+
+# China has no DST. Unlike a pytz zone, which falls back to its LMT offset (+08:06)
+# when passed as tzinfo, a fixed offset can be given to datetime() directly.
+SHANGHAI = timezone(timedelta(hours=8), "Asia/Shanghai")
+
+
+def to_timestamp(time: datetime) -> int:
+    return int(time.timestamp())
+
+
+def to_isoformat(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp, tz=SHANGHAI).isoformat()
+
+
+def get_page_url(post_url: str, page: int) -> str:
+    return post_url if page == 1 else post_url[:-5] + f"-{page}.html"
+
+
+class Record:
+    """Base for the slotted records below, which take their slots as arguments."""
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        # rebuild through __init__ so strings from worker processes are interned
+        return self.__class__, tuple(getattr(self, slot) for slot in self.__slots__)
+
+
+class Floor(Record):
+    """A floor of a post. Its url is derived from the post url and page."""
+
+    __slots__ = ("floor_num", "floor_id", "page", "username", "content", "time")
+
+    def __init__(
+        self,
+        floor_num: int,
+        floor_id: str,
+        page: int,
+        username: str,
+        content: str,
+        time: int,
+    ) -> None:
+        self.floor_num = floor_num
+        self.floor_id = floor_id
+        self.page = page
+        self.username = intern(username)
+        self.content = content
+        self.time = time
+
+    def to_dict(self, post_url: str) -> Dict:
+        return {
+            "floor_id": self.floor_id,
+            "floor_url": f"{get_page_url(post_url, self.page)}#{self.floor_id}",
+            "username": self.username,
+            "content": self.content,
+            "time": to_isoformat(self.time),
+        }
+
+
+class Post(Record):
+    """A post in a sub, with the floors that matched, sorted by floor number."""
+
+    __slots__ = (
+        "sub",
+        "sub_id",
+        "post_id",
+        "post_url",
+        "post_title",
+        "n_pages",
+        "last_reply_time",
+        "floors",
+    )
+
+    def __init__(
+        self,
+        sub: str,
+        sub_id: str,
+        post_id: str,
+        post_url: str,
+        post_title: str,
+        n_pages: int,
+        last_reply_time: int,
+        floors: List[Floor] = None,
+    ) -> None:
+        self.sub = intern(sub)
+        self.sub_id = intern(sub_id)
+        self.post_id = intern(post_id)
+        self.post_url = post_url
+        self.post_title = post_title
+        self.n_pages = n_pages
+        self.last_reply_time = last_reply_time
+        self.floors = [] if floors is None else floors
+
+    def meta_to_dict(self) -> Dict:
+        return {
+            "sub": self.sub,
+            "sub_id": self.sub_id,
+            "post_url": self.post_url,
+            "post_title": self.post_title,
+            "n_pages": self.n_pages,
+            "last_reply_time": to_isoformat(self.last_reply_time),
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            "meta": self.meta_to_dict(),
+            "floors": {
+                floor.floor_num: floor.to_dict(self.post_url) for floor in self.floors
+            },
+        }
+
+
+class Reply(Record):
+    """A reply to be sent, quoting a floor of a post."""
+
+    __slots__ = ("quote_floor_id", "content", "sub_id", "post_id")
+
+    def __init__(
+        self, quote_floor_id: str, content: str, sub_id: str, post_id: str
+    ) -> None:
+        self.quote_floor_id = quote_floor_id
+        self.content = content
+        self.sub_id = intern(sub_id)
+        self.post_id = intern(post_id)
+
+    def to_dict(self) -> Dict:
+        return {
+            "quote_floor_id": self.quote_floor_id,
+            "content": self.content,
+            "sub_id": self.sub_id,
+            "post_id": self.post_id,
+        }
+
+
+def write_posts(posts: List[Post], f: TextIO) -> None:
+    """Write posts as one JSON object, one post at a time. Consumes the list."""
+    if not posts:
+        f.write("{}")
+        return
+    posts.reverse()
+    separator = "{\n    "
+    while posts:
+        post = posts.pop()
+        post_json = json.dumps(post.to_dict(), indent=4, ensure_ascii=False)
+        f.write(f"{separator}{json.dumps(post.post_id)}: ")
+        f.write(post_json.replace("\n", "\n    "))
+        separator = ",\n    "
+    f.write("\n}")
@@ -10,6 +10,7 @@ import urllib3
 from fake_useragent import UserAgent
 
 from exceptions import AccountBannedException, PostDeletedException
+from records import Reply
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -134,7 +135,7 @@ class SendPost:
         }
         return reply_type_function(**reply_type_kwargs)
 
-    def get_replies_metadata(self, queries, reply_type):
+    def get_replies_metadata(self, queries, reply_type) -> List[Reply]:
         with open(f"data/{self.sub_name}/floors.json", encoding="utf-8") as f:
             floors_to_reply = json.loads(f.read())
         reply_metadata = []
@@ -158,19 +159,23 @@ class SendPost:
                             quote_content=quote_content,
                         )
                         reply_metadata.append(
-                            {
-                                "quote_floor_id": floor_id,
-                                "content": f"{content}\n\n{self.signature}",
-                                "sub_id": sub_id,
-                                "post_id": post_id,
-                            }
+                            Reply(
+                                quote_floor_id=floor_id,
+                                content=f"{content}\n\n{self.signature}",
+                                sub_id=sub_id,
+                                post_id=post_id,
+                            )
                         )
         return reply_metadata
 
     def get_all_replies(self):
         replies = self.get_replies_metadata(self.queries, self.reply_type)
         with open(f"data/{self.sub_name}/replies.json", "w", encoding="utf-8") as f:
-            f.write(json.dumps(replies, indent=4, ensure_ascii=False))
+            f.write(
+                json.dumps(
+                    [reply.to_dict() for reply in replies], indent=4, ensure_ascii=False
+                )
+            )
         return replies
 
     def mark_replied_floors(self):
@@ -225,13 +230,13 @@ class SendPost:
             self.recently_replied_floors.append(replied_floor)
             return response
 
-    async def send_reply(self, metadata):
-        post_id = metadata["post_id"]
-        sub_id = metadata["sub_id"]
+    async def send_reply(self, metadata: Reply):
+        post_id = metadata.post_id
+        sub_id = metadata.sub_id
         if sub_id in self.banned_sub_ids or post_id in self.deleted_post_ids:
             return -1
-        quote_floor_id = metadata["quote_floor_id"]
-        content = metadata["content"]
+        quote_floor_id = metadata.quote_floor_id
+        content = metadata.content
         payload = {
             "atc_content": self.format_newlines(content),
             "step": 2,